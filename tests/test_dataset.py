@@ -58,4 +58,59 @@ def test_special_case_de_bilt():
     cities = dataset.get_cities()
 
     assert "DE_BILT" in cities
-    assert "DE" not in cities
\ No newline at end of file
+    assert "DE" not in cities
+def dated_dataframe():
+    return pd.DataFrame({
+        "DATE": [20200115, 20200415, 20200715, 20201015, 20210115],
+        "UT_temp_mean": [10.0, 20.0, 30.0, 40.0, 50.0]
+    })
+
+def test_filter_by_month_matches_boolean_mask():
+    dataset = WeatherDataset(dated_dataframe())
+    data = dataset.get_data()
+
+    expected = data[data.index.month == 1]
+
+    assert dataset.filter_by_month(1).equals(expected)
+
+def test_filter_by_year_matches_boolean_mask():
+    dataset = WeatherDataset(dated_dataframe())
+    data = dataset.get_data()
+
+    expected = data[data.index.year == 2020]
+
+    assert dataset.filter_by_year(2020).equals(expected)
+
+def test_filter_by_year_missing_returns_empty():
+    dataset = WeatherDataset(dated_dataframe())
+
+    assert dataset.filter_by_year(1999).empty
+
+def test_filter_by_month_and_year():
+    dataset = WeatherDataset(dated_dataframe())
+
+    filtered = dataset.filter_by_month_and_year(1, 2020)
+
+    assert len(filtered) == 1
+    assert filtered["UT_temp_mean"].iloc[0] == 10.0
+
+def test_filter_by_date_range():
+    dataset = WeatherDataset(dated_dataframe())
+
+    filtered = dataset.filter_by_date_range("2020-04-01", "2020-10-31")
+
+    assert list(filtered["UT_temp_mean"]) == [20.0, 30.0, 40.0]
+
+def test_filter_by_season():
+    dataset = WeatherDataset(dated_dataframe())
+
+    assert len(dataset.filter_by_season("Winter")) == 2
+    assert len(dataset.filter_by_season("spring")) == 1
+    assert len(dataset.filter_by_season("summer")) == 1
+    assert len(dataset.filter_by_season("fall")) == 1
+
+def test_filter_by_season_invalid_raises():
+    dataset = WeatherDataset(dated_dataframe())
+
+    with pytest.raises(ValueError):
+        dataset.filter_by_season("monsoon")
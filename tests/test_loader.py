@@ -35,4 +35,35 @@ def test_load_file_not_found():
     loader = WeatherDataLoader("does_not_exist.csv")
 
     with pytest.raises(FileNotFoundError):
-        loader.load()
\ No newline at end of file
+        loader.load()
+
+def test_load_downcasts_floats(tmp_path):
+    """
+    Ensure float columns come back as float32 after loading.
+    """
+    file_path = tmp_path / "sample.csv"
+    df = pd.DataFrame({
+        "DATE": [20200101, 20200102],
+        "UT_temp_mean": [1.5, 2.5]
+    })
+    df.to_csv(file_path, index=False)
+
+    dataset = WeatherDataLoader(str(file_path)).load()
+
+    assert dataset.get_data()["UT_temp_mean"].dtype == "float32"
+
+
+def test_polars_backend_requires_polars():
+    """
+    Ensure the polars backend raises ImportError when polars is missing.
+    """
+    try:
+        import polars  # noqa: F401
+        pytest.skip("polars is installed")
+    except ImportError:
+        pass
+
+    loader = WeatherDataLoader("does_not_exist.csv", backend="polars")
+
+    with pytest.raises(ImportError):
+        loader.load()
@@ -74,4 +74,54 @@ def test_temperature_summary():
     assert summary["Max"] == 50
     assert summary["Standard deviation"] == 10
     assert summary["Range"] == 20
-    assert summary["Mode"] == 30
\ No newline at end of file
+    assert summary["Mode"] == 30
+def test_temperature_summary_returns_dict():
+    ds = sample_dataframe()
+    stats = WeatherStats(ds)
+
+    summary = stats.temperature_summary("SLC")
+
+    assert isinstance(summary, dict)
+    assert list(summary) == ["Mean", "Median", "Min", "Max",
+                             "Standard deviation", "Range", "Mode"]
+
+def test_temperature_summary_empty_frame_returns_nan():
+    ds = sample_dataframe()
+    stats = WeatherStats(ds)
+
+    empty = ds.get_data().iloc[0:0]
+    summary = stats.temperature_summary("SLC", empty)
+
+    assert all(value != value for value in summary.values())  # all NaN
+
+def test_stats_skip_nan():
+    import numpy as np
+    df = pd.DataFrame({"UT_temp_mean": [10.0, np.nan, 30.0]})
+    stats = WeatherStats(WeatherDataset(df))
+
+    assert stats.mean("UT_temp_mean") == 20.0
+    assert stats.median("UT_temp_mean") == 20.0
+    assert stats.min("UT_temp_mean") == 10.0
+    assert stats.max("UT_temp_mean") == 30.0
+    assert stats.range("UT_temp_mean") == 20.0
+
+def test_temperature_summary_is_cached():
+    ds = sample_dataframe()
+    stats = WeatherStats(ds)
+
+    first = stats.temperature_summary("SLC")
+
+    assert stats.temperature_summary("SLC") is first
+    stats.clear_cache()
+    assert stats.temperature_summary("SLC") is not first
+
+def test_summary_all_cities():
+    ds = sample_dataframe()
+    stats = WeatherStats(ds)
+
+    summaries = stats.summary_all_cities()
+
+    # Only cities with a *_temp_mean column, so no "other".
+    assert set(summaries) == {"SLC", "LA"}
+    assert summaries["SLC"]["Mean"] == 40
+    assert summaries["LA"]["Mode"] == 70
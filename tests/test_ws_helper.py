@@ -54,3 +54,14 @@ def test_run_cli_date_range_filter(monkeypatch):
     monkeypatch.setattr(builtins, "input", lambda _: next(inputs))
     stub_plot(monkeypatch)
     run_cli(dataset, stats)
+
+
+def test_run_cli_out_of_range_dates(monkeypatch):
+    dataset = make_dataset()
+    stats = WeatherStats(dataset)
+    # A date range outside the dataset yields an empty frame; the CLI
+    # should print NaN stats rather than crash.
+    inputs = iter(["UT", "5", "1990-01-01", "1990-12-31", "0", "Q"])
+    monkeypatch.setattr(builtins, "input", lambda _: next(inputs))
+    stub_plot(monkeypatch)
+    run_cli(dataset, stats)
@@ -0,0 +1,50 @@
+"""
+Optional Numba-compiled kernels for the statistics hot path.
+
+Importing this module never requires numba: `summarize` is None when
+numba is unavailable, and callers fall back to the NumPy path.
+"""
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # fastmath flags exclude 'nnan' so the NaN-skip check inside the
+    # loop is not optimized away.
+    @njit(cache=True, fastmath={"contract", "reassoc", "nsz", "arcp"})
+    def summarize(arr):
+        """
+        Single-pass count/mean/M2/min/max over a numeric array.
+
+        Uses Welford's online algorithm for a numerically stable mean
+        and variance accumulator in one traversal, skipping NaNs.
+        Compiled with ``cache=True`` so the JIT cost is paid once per
+        machine, not per run.
+
+        Args:
+            arr: A one-dimensional numeric array.
+
+        Returns:
+            A tuple ``(n, mean, m2, mn, mx)`` where ``m2`` is the sum of
+            squared deviations; sample std is ``sqrt(m2 / (n - 1))``.
+        """
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        mn = float("inf")
+        mx = float("-inf")
+        for x in arr:
+            if x != x:  # NaN
+                continue
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+        return n, mean, m2, mn, mx
+else:
+    summarize = None
@@ -1,8 +1,13 @@
+import numpy as np
 import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Special case since DE_BILT is the only city name with two words.
+# Prevents the second half from being cut off during extraction.
+_CITY_RENAMES = {"DE": "DE_BILT"}
+
 class WeatherDataset:
     """
     Wrapper around a pandas DataFrame that represents weather data.
@@ -28,13 +33,70 @@ class WeatherDataset:
             data: A pandas DataFrame containing weather measurements.
         """
         self._data = data
-        self._data['DATE'] = pd.to_datetime(data['DATE'], format='%Y%m%d')
-        self._data = self._data.set_index('DATE')
-        self._cities = self.get_cities()
+        if 'DATE' in self._data.columns:
+            self._data['DATE'] = self._parse_dates(data['DATE'])
+            self._data = self._data.set_index('DATE')
+        # Temperatures only carry a few significant digits, so float32 is
+        # plenty and halves the bytes every statistic has to scan.
+        float_cols = self._data.select_dtypes(include='float').columns
+        if len(float_cols):
+            self._data[float_cols] = self._data[float_cols].astype(np.float32)
+        self._cities = self._compute_cities()
+        self._cities_set = frozenset(self._cities)
+        self._build_date_groups()
+
+    @staticmethod
+    def _parse_dates(dates: pd.Series) -> pd.DatetimeIndex:
+        """
+        Convert a YYYYMMDD date column to a DatetimeIndex.
+
+        Dates stored as integers are split into year/month/day with two
+        vectorized divmods, which is much faster than running the
+        format-string parser over every row. Anything else falls back to
+        the regular `%Y%m%d` parse.
+
+        Args:
+            dates: The raw DATE column.
+
+        Returns:
+            The parsed dates as a DatetimeIndex.
+        """
+        values = dates.to_numpy()
+        if np.issubdtype(values.dtype, np.integer):
+            years, month_day = np.divmod(values, 10000)
+            months, days = np.divmod(month_day, 100)
+            return pd.DatetimeIndex(
+                pd.to_datetime({'year': years, 'month': months, 'day': days}))
+        return pd.DatetimeIndex(pd.to_datetime(dates, format='%Y%m%d'))
+
+    def _build_date_groups(self):
+        """
+        Precompute positional row indices grouped by month, year and season.
+
+        The month/year filters are called repeatedly from the CLI loop;
+        recomputing `index.month`/`index.year` and a boolean mask on every
+        call allocates a full-length array each time. Grouping the row
+        positions once turns each filter into a single `take`.
+        """
+        idx = self._data.index
+        if not isinstance(idx, pd.DatetimeIndex):
+            self._month_groups = {}
+            self._year_groups = {}
+            self._season_groups = {}
+            return
+        months = idx.month.to_numpy()
+        years = idx.year.to_numpy()
+        self._month_groups = {m: np.where(months == m)[0] for m in range(1, 13)}
+        self._year_groups = {y: np.where(years == y)[0] for y in np.unique(years)}
+        self._season_groups = {
+            'spring': np.where((months >= 3) & (months <= 5))[0],
+            'summer': np.where((months >= 6) & (months <= 8))[0],
+            'fall': np.where((months >= 9) & (months <= 11))[0],
+            'winter': np.where((months == 12) | (months <= 2))[0],
+        }
 
     def __iter__(self):
-        for city in self._cities:
-            yield city
+        return iter(self._cities)
 
     def get_data(self) -> pd.DataFrame:
         """
@@ -77,12 +139,11 @@ class WeatherDataset:
 
     def get_cities(self) -> list[str]:
         """
-        Extract unique city names from the dataset based on column naming.
+        Return the unique city names detected in the dataset.
 
         The dataset columns use a naming convention such as
-        `<CITY>_temp_mean`. This method extracts the `<CITY>`
-        portion (before the first underscore) and returns the
-        unique list of cities.
+        `<CITY>_temp_mean`. City names are extracted once during
+        initialization and cached, so repeated calls are free.
 
         Returns:
             A list of unique city identifiers (strings).
@@ -97,13 +158,23 @@ class WeatherDataset:
         >>> sorted(dataset.get_cities())
         ['CA', 'UT']
         """
-        cities = self._data.columns[self._data.columns.str.contains("_")].str.split("_").str[0].unique().tolist()
-        for i in range(len(cities)):
-            # Special case since this is the only city name with two words.
-            # Prevents second half from being cut off.
-            if cities[i] == "DE":
-                cities[i] = "DE_BILT"
+        if self._cities is None:
+            self._cities = self._compute_cities()
+        return self._cities
+
+    def _compute_cities(self) -> list[str]:
+        """
+        Extract unique city names from the column naming convention.
 
+        Plain string splits on the column names are used instead of the
+        pandas `.str` accessor since the column list is small and the
+        accessor allocates intermediate arrays on every call.
+
+        Returns:
+            A list of unique city identifiers (strings).
+        """
+        prefixes = (c.split("_", 1)[0] for c in self._data.columns if "_" in c)
+        cities = list(dict.fromkeys(_CITY_RENAMES.get(p, p) for p in prefixes))
         logger.info("Detected cities: %s", cities)
         return cities
 
@@ -126,7 +197,7 @@ class WeatherDataset:
         >>> dataset.has_city("NO_SUCH_CITY")
         False
         """
-        return city_name in self._cities
+        return city_name in self._cities_set
 
     def filter_by_month(self, month: int) -> pd.DataFrame:
         """
@@ -138,7 +209,7 @@ class WeatherDataset:
         Returns:
             A new DataFrame containing only rows from the specified month.
         """
-        return self._data[self._data.index.month == month]
+        return self._data.take(self._month_groups[month])
 
     def filter_by_year(self, year: int) -> pd.DataFrame:
         """
@@ -149,7 +220,7 @@ class WeatherDataset:
         Returns:
             A new DataFrame containing only rows from the specified year.
         """
-        return self._data[self._data.index.year == year]
+        return self._data.take(self._year_groups.get(year, np.array([], dtype=np.intp)))
 
     def filter_by_month_and_year(self, month: int, year: int) -> pd.DataFrame:
         """
@@ -162,7 +233,10 @@ class WeatherDataset:
         Returns:
             A new DataFrame containing only rows from the specified month and year.
         """
-        return self._data[(self._data.index.month == month) & (self._data.index.year == year)]
+        rows = np.intersect1d(self._month_groups[month],
+                              self._year_groups.get(year, np.array([], dtype=np.intp)),
+                              assume_unique=True)
+        return self._data.take(rows)
 
     def filter_by_date_range(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -197,16 +271,9 @@ class WeatherDataset:
             A new DataFrame containing only rows from the specified season.
         """
         season = season.lower()
-        if season == 'spring':
-            return self._data[(self._data.index.month >= 3) & (self._data.index.month <= 5)]
-        elif season == 'summer':
-            return self._data[(self._data.index.month >= 6) & (self._data.index.month <= 8)]
-        elif season == 'fall':
-            return self._data[(self._data.index.month >= 9) & (self._data.index.month <= 11)]
-        elif season == 'winter':
-            return self._data[(self._data.index.month == 12) | (self._data.index.month <= 2)]
-        else:
+        if season not in self._season_groups:
             raise ValueError("Invalid season. Must be one of: 'spring', 'summer', 'fall', 'winter'.")
+        return self._data.take(self._season_groups[season])
 
 
 
@@ -4,14 +4,57 @@ Command-line helper utilities for the weather_stats package.
 Provides:
 - `ask_until_valid` - prompt loop that parses and validates user input.
 - `run_cli` - interactive CLI loop to pick a city, apply filters and display statistics.
+- `summarize_all_cities` - compute temperature summaries for every city in parallel.
 """
 import logging
+import re
 from typing import Callable, Optional, Any
 import pandas as pd
 from matplotlib import pyplot as plt
 
 logger = logging.getLogger(__name__)
 
+_SEASONS = frozenset({"Winter", "Spring", "Summer", "Fall"})
+_FILTER_CHOICES = range(0, 7)
+# Plot labels for the seven summary statistics, in the order
+# temperature_summary returns them.
+_SUMMARY_LABELS = ("Mean", "Median", "Min", "Max", "Std Dev", "Range", "Mode")
+
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _parse_date(s):
+    """Parse a YYYY-MM-DD string into a Timestamp, raising on bad input."""
+    # Cheap regex reject first, so malformed input skips the cost of
+    # pandas raising and the prompt loop catching the exception.
+    if not _DATE_RE.match(s):
+        raise ValueError(f"Invalid date: {s!r}")
+    # pd.Timestamp parses a single scalar directly, skipping the
+    # vectorized dispatch and format inference of pd.to_datetime.
+    return pd.Timestamp(s)
+
+
+def _valid_month(m):
+    """Return True for months 1-12."""
+    return 1 <= m <= 12
+
+
+def _valid_year(y):
+    """Return True for years within the dataset's 2000-2010 span."""
+    return 2000 <= y <= 2010
+
+
+def _valid_season(s):
+    """Return True for one of the four season names."""
+    return s in _SEASONS
+
+
+def _valid_filter_choice(v):
+    """Return True for menu choices 0-6."""
+    return v in _FILTER_CHOICES
+
+
 def ask_until_valid(prompt: str,
                     parser: Callable[[str], Any],
                     validator: Optional[Callable[[Any], bool]] = None,
@@ -49,6 +92,86 @@ def ask_until_valid(prompt: str,
         return val
 
 
+def _filter_month(dataset):
+    """Prompt for a month and return the filtered DataFrame and graph title."""
+    month = ask_until_valid("Enter month (1-12): ", int, _valid_month, "Month must be 1-12")
+    return dataset.filter_by_month(month), f"{month} (all years)"
+
+
+def _filter_year(dataset):
+    """Prompt for a year and return the filtered DataFrame and graph title."""
+    year = ask_until_valid("Enter year (2000 - 2010): ", int, _valid_year,
+                           "Year must be between 2000 and 2010")
+    return dataset.filter_by_year(year), f"{year}"
+
+
+def _filter_month_and_year(dataset):
+    """Prompt for a month and a year and return the filtered DataFrame and graph title."""
+    month = ask_until_valid("Enter month (1-12): ", int, _valid_month, "Month must be 1-12")
+    year = ask_until_valid("Enter year (2000 - 2010): ", int, _valid_year,
+                           "Year must be between 2000 and 2010")
+    return dataset.filter_by_month_and_year(month, year), f"{month}/{year}"
+
+
+def _filter_date_range(dataset):
+    """Prompt for start/end dates and return the filtered DataFrame and graph title."""
+    start_date = ask_until_valid("Enter start date (YYYY-MM-DD): ",
+                                 _parse_date,
+                                 None,
+                                 "Invalid date format")
+    end_date = ask_until_valid("Enter end date (YYYY-MM-DD): ",
+                               _parse_date,
+                               None,
+                               "Invalid date format")
+    return (dataset.filter_by_date_range(start_date, end_date),
+            f"{start_date.date()} to {end_date.date()}")
+
+
+def _filter_season(dataset):
+    """Prompt for a season and return the filtered DataFrame and graph title."""
+    season = ask_until_valid("Enter season (Winter, Spring, Summer, Fall): ",
+                             str.title,
+                             _valid_season,
+                             "Invalid season")
+    return dataset.filter_by_season(season), f"{season} (all years)"
+
+
+# Filter-menu choices mapped to their handlers; choice 1 (all-time) needs
+# no handler since the stats default to the full dataset, and choice 0
+# returns to city selection.
+_FILTERS = {
+    2: _filter_month,
+    3: _filter_year,
+    4: _filter_month_and_year,
+    5: _filter_date_range,
+    6: _filter_season,
+}
+
+
+def summarize_all_cities(dataset, stats) -> dict[str, dict[str, float]]:
+    """
+    Compute temperature summaries for every city in the dataset.
+
+    Thin wrapper around `WeatherStats.summary_all_cities`, which fans the
+    work out across a thread pool. The stats object's own default city
+    list is used rather than `dataset.get_cities()`, since the latter can
+    contain column stems with no temperature column.
+
+    Args:
+        dataset: An object providing the same public interface as `WeatherDataset`.
+        stats: A `WeatherStats` instance used to compute statistics.
+
+    Returns:
+        A dict mapping each city to its dict of statistic names and values.
+
+    Example:
+        >>> summaries = summarize_all_cities(dataset, stats)  # doctest: +SKIP
+        >>> summaries["UT"]["Mean"]  # doctest: +SKIP
+        20.0
+    """
+    return stats.summary_all_cities()
+
+
 def run_cli(dataset, stats):
     """
     Run the interactive command-line loop to select a city, apply filters and show statistics.
@@ -69,15 +192,19 @@ def run_cli(dataset, stats):
         >>> # called from main with proper dataset and stats objects
         >>> run_cli(dataset, stats)
     """
-    results = []
-    x_labels = []
+    results = [0.0] * len(_SUMMARY_LABELS)
     for city in dataset.get_cities():
         print(city)
 
+    # One figure reused for the whole session; creating and tearing down
+    # a figure per filter choice costs far more than the stats themselves.
+    fig, ax = plt.subplots()
+
     while True:
-        user_choice = ask_until_valid("Enter a city name for weather data (Enter 'Q' to quit): ", lambda s: s.upper(), lambda s: s == "Q" or dataset.has_city(s), "City not found. Please try again.")
+        user_choice = ask_until_valid("Enter a city name for weather data (Enter 'Q' to quit): ", str.upper, lambda s: s == "Q" or dataset.has_city(s), "City not found. Please try again.")
         if user_choice == "Q":
             print("Goodbye")
+            plt.close(fig)
             break
 
         while True:
@@ -90,55 +217,21 @@ def run_cli(dataset, stats):
                   "     6. Filter by season\n"
                   "     0. Return to city selection\n")
 
-            filter_choice = ask_until_valid("Choose a filter option (0-6): ", int, lambda v: 0 <= v <= 6,
+            filter_choice = ask_until_valid("Choose a filter option (0-6): ", int, _valid_filter_choice,
                                             "Enter a number between 0 and 6.")
 
+            # Return to city selection
+            if filter_choice == 0:
+                break
+
             filtered_dataframe = None
             graph_title = "All-time"
+            # Choice 1 has no handler since the stats default to the
+            # full dataset when None is passed.
+            handler = _FILTERS.get(filter_choice)
             try:
-                # Skip #1 since the filters will default to using the full dataset if None is passed.
-                # Filtering by month (all years)
-                if filter_choice == 2:
-                    month = ask_until_valid("Enter month (1-12): ", int, lambda m: 1 <= m <= 12, "Month must be 1-12")
-                    filtered_dataframe = dataset.filter_by_month(month)
-                    graph_title = f"{month} (all years)"
-                # Filtering by year (all months)
-                elif filter_choice == 3:
-                    year = ask_until_valid("Enter year (2000 - 2010): ", int, lambda y: 2000 <= y <= 2010,
-                                           "Year must be between 2000 and 2010")
-                    filtered_dataframe = dataset.filter_by_year(year)
-                    graph_title = f"{year}"
-                # Filtering by month and year
-                elif filter_choice == 4:
-                    month = ask_until_valid("Enter month (1-12): ", int, lambda m: 1 <= m <= 12, "Month must be 1-12")
-                    year = ask_until_valid("Enter year (2000 - 2010): ", int, lambda y: 2000 <= y <= 2010,
-                                           "Year must be between 2000 and 2010")
-                    filtered_dataframe = dataset.filter_by_month_and_year(month, year)
-                    graph_title = f"{month}/{year}"
-                # Filtering by date range
-                elif filter_choice == 5:
-                    start_date = ask_until_valid("Enter start date (YYYY-MM-DD): ",
-                                                 lambda s: pd.to_datetime(s, format="%Y-%m-%d", errors="raise"),
-                                                 None,
-                                                 "Invalid date format")
-                    end_date = ask_until_valid("Enter end date (YYYY-MM-DD): ",
-                                               lambda s: pd.to_datetime(s, format="%Y-%m-%d", errors="raise"),
-                                               None,
-                                               "Invalid date format")
-                    filtered_dataframe = dataset.filter_by_date_range(start_date, end_date)
-                    graph_title = f"{start_date.date()} to {end_date.date()}"
-                # Filtering by season (all years)
-                elif filter_choice == 6:
-                    season = ask_until_valid("Enter season (Winter, Spring, Summer, Fall): ",
-                                             lambda s: s.title(),
-                                             lambda s: s in {"Winter", "Spring", "Summer", "Fall"},
-                                             "Invalid season")
-                    filtered_dataframe = dataset.filter_by_season(season)
-                    graph_title = f"{season} (all years)"
-                # Return to city selection
-                elif filter_choice == 0:
-                    break
-
+                if handler is not None:
+                    filtered_dataframe, graph_title = handler(dataset)
             except ValueError as e:
                 # dataset methods can raise on invalid ranges; handle centrally
                 print(f"Filter error: {e}")
@@ -147,19 +240,17 @@ def run_cli(dataset, stats):
 
             filtered_weather_data = stats.temperature_summary(user_choice, filtered_dataframe)
             print(f"Temperature statistics for {user_choice}:")
-            for stat, value in filtered_weather_data:
+            for i, (stat, value) in enumerate(filtered_weather_data.items()):
                 print(f"{stat}: {value}")
-                results.append(value)
-                x_labels.append(stat if stat != "Standard deviation" else "Std Dev")
-
-            plt.plot(results, 'o')
-            plt.grid(True)
-            plt.xticks(range(len(x_labels)), x_labels)
-            plt.title(f"Weather trends: {user_choice} - {graph_title}")
-            plt.ylabel("Temperature (°C)")
-            plt.show()
-
-            results.clear()
-            x_labels.clear()
-            plt.close()
+                results[i] = value
+
+            ax.cla()
+            ax.plot(results, 'o')
+            ax.grid(True)
+            ax.set_xticks(range(len(_SUMMARY_LABELS)))
+            ax.set_xticklabels(_SUMMARY_LABELS)
+            ax.set_title(f"Weather trends: {user_choice} - {graph_title}")
+            ax.set_ylabel("Temperature (°C)")
+            fig.canvas.draw_idle()
+            plt.pause(0.001)
 